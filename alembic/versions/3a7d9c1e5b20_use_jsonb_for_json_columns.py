@@ -0,0 +1,80 @@
+"""Use JSONB for JSON payload columns.
+
+Revision ID: 3a7d9c1e5b20
+Revises: 05c2c5f44812
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a7d9c1e5b20"
+down_revision: Union[str, None] = "05c2c5f44812"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    """Return True if the table exists (some tables are created by init_db)."""
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Convert JSON columns to JSONB and index the raw payloads."""
+    op.alter_column(
+        "market_data",
+        "raw_data",
+        type_=postgresql.JSONB(),
+        postgresql_using="raw_data::jsonb",
+    )
+    op.alter_column(
+        "raw_market_data",
+        "raw_data",
+        type_=postgresql.JSONB(),
+        postgresql_using="raw_data::jsonb",
+    )
+    op.create_index(
+        "ix_raw_market_data_raw_data",
+        "raw_market_data",
+        ["raw_data"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"raw_data": "jsonb_path_ops"},
+    )
+    if _has_table("polling_configs"):
+        op.alter_column(
+            "polling_configs",
+            "device_ids",
+            type_=postgresql.JSONB(),
+            postgresql_using="device_ids::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Revert JSONB columns to JSON."""
+    if _has_table("polling_configs"):
+        op.alter_column(
+            "polling_configs",
+            "device_ids",
+            type_=sa.JSON(),
+            postgresql_using="device_ids::json",
+        )
+    op.drop_index("ix_raw_market_data_raw_data", table_name="raw_market_data")
+    op.alter_column(
+        "raw_market_data",
+        "raw_data",
+        type_=sa.JSON(),
+        postgresql_using="raw_data::json",
+    )
+    op.alter_column(
+        "market_data",
+        "raw_data",
+        type_=sa.JSON(),
+        postgresql_using="raw_data::json",
+    )
@@ -0,0 +1,69 @@
+"""Add composite (device_id, timestamp DESC) indexes.
+
+Revision ID: 8c41f2d7a9e3
+Revises: 3a7d9c1e5b20
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c41f2d7a9e3"
+down_revision: Union[str, None] = "3a7d9c1e5b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    """Return True if the table exists (some tables are created by init_db)."""
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Replace single-column device_id indexes with composite ones."""
+    if _has_table("sensor_readings"):
+        op.create_index(
+            "ix_sensor_readings_device_ts",
+            "sensor_readings",
+            ["device_id", sa.text("timestamp DESC")],
+            unique=False,
+            postgresql_include=["reading_value"],
+        )
+        op.execute("DROP INDEX IF EXISTS ix_sensor_readings_device_id")
+
+    if _has_table("rolling_averages"):
+        op.create_index(
+            "ix_rolling_averages_device_type_ts",
+            "rolling_averages",
+            ["device_id", "reading_type", sa.text("timestamp DESC")],
+            unique=False,
+        )
+        op.execute("DROP INDEX IF EXISTS ix_rolling_averages_device_id")
+
+
+def downgrade() -> None:
+    """Restore the single-column device_id indexes."""
+    if _has_table("rolling_averages"):
+        op.create_index(
+            "ix_rolling_averages_device_id",
+            "rolling_averages",
+            ["device_id"],
+            unique=False,
+        )
+        op.drop_index(
+            "ix_rolling_averages_device_type_ts", table_name="rolling_averages"
+        )
+
+    if _has_table("sensor_readings"):
+        op.create_index(
+            "ix_sensor_readings_device_id",
+            "sensor_readings",
+            ["device_id"],
+            unique=False,
+        )
+        op.drop_index("ix_sensor_readings_device_ts", table_name="sensor_readings")
@@ -0,0 +1,39 @@
+"""Store missing raw_data payloads as SQL NULL.
+
+Revision ID: a4e1c8d2f630
+Revises: f27c94b1e8a5
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4e1c8d2f630"
+down_revision: Union[str, None] = "f27c94b1e8a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("sensor_readings", "raw_telemetry")
+
+
+def _has_table(name: str) -> bool:
+    """Return True if the table exists (some tables are created by init_db)."""
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Replace JSON null payloads written by the ORM/Core paths with SQL NULL."""
+    for table in TABLES:
+        if _has_table(table):
+            op.execute(
+                f"UPDATE {table} SET raw_data = NULL WHERE raw_data = 'null'::jsonb"
+            )
+
+
+def downgrade() -> None:
+    """Nothing to undo: SQL NULL is the canonical empty payload."""
@@ -0,0 +1,74 @@
+"""Store raw telemetry payloads as JSONB.
+
+Revision ID: b52e07c4d1a8
+Revises: 8c41f2d7a9e3
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b52e07c4d1a8"
+down_revision: Union[str, None] = "8c41f2d7a9e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("sensor_readings", "raw_telemetry")
+
+# Legacy rows holding a JSON object are cast with ::jsonb. Anything else
+# (free-form text, bare JSON scalars) is kept as a JSON string via to_jsonb,
+# because a plain ::jsonb cast would fail on non-JSON text.
+CONVERT_FUNCTION = "_raw_data_to_jsonb"
+CREATE_CONVERT_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION {CONVERT_FUNCTION}(value text) RETURNS jsonb
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    parsed jsonb;
+BEGIN
+    parsed := value::jsonb;
+    IF jsonb_typeof(parsed) = 'object' THEN
+        RETURN parsed;
+    END IF;
+    RETURN to_jsonb(value);
+EXCEPTION WHEN invalid_text_representation OR untranslatable_character THEN
+    RETURN to_jsonb(value);
+END
+$$
+"""
+
+
+def _has_table(name: str) -> bool:
+    """Return True if the table exists (some tables are created by init_db)."""
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Convert raw_data from text to JSONB."""
+    op.execute(CREATE_CONVERT_FUNCTION)
+    for table in TABLES:
+        if _has_table(table):
+            op.alter_column(
+                table,
+                "raw_data",
+                type_=postgresql.JSONB(),
+                postgresql_using=f"{CONVERT_FUNCTION}(raw_data)",
+            )
+    op.execute(f"DROP FUNCTION {CONVERT_FUNCTION}(text)")
+
+
+def downgrade() -> None:
+    """Convert raw_data back to text."""
+    for table in TABLES:
+        if _has_table(table):
+            op.alter_column(
+                table,
+                "raw_data",
+                type_=sa.String(),
+                postgresql_using="raw_data #>> '{}'",
+            )
@@ -0,0 +1,41 @@
+"""Convert time-series tables to TimescaleDB hypertables.
+
+Revision ID: d19a6e3f4c72
+Revises: b52e07c4d1a8
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.core.config import settings
+from app.db.timescale import create_hypertables
+
+# revision identifiers, used by Alembic.
+revision: str = "d19a6e3f4c72"
+down_revision: Union[str, None] = "b52e07c4d1a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Partition time-series tables into daily chunks on timestamp.
+
+    Tables that init_db has not created yet are skipped here; init_db
+    converts them when it creates them.
+    """
+    if not settings.TIMESCALEDB_ENABLED:
+        return
+
+    create_hypertables(op.get_bind())
+
+
+def downgrade() -> None:
+    """
+    Leave hypertables in place.
+
+    TimescaleDB cannot convert a hypertable back into a plain table; restore
+    from a dump taken before the upgrade if that is required.
+    """
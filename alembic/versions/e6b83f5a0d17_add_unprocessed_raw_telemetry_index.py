@@ -0,0 +1,60 @@
+"""Add partial index on unprocessed raw telemetry.
+
+Revision ID: e6b83f5a0d17
+Revises: d19a6e3f4c72
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b83f5a0d17"
+down_revision: Union[str, None] = "d19a6e3f4c72"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    """Return True if the table exists (some tables are created by init_db)."""
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Store processed as a boolean and index only the unprocessed rows."""
+    if not _has_table("raw_telemetry"):
+        return
+
+    op.alter_column(
+        "raw_telemetry",
+        "processed",
+        type_=sa.Boolean(),
+        existing_nullable=False,
+        postgresql_using="processed <> 0",
+    )
+    op.create_index(
+        "ix_raw_telemetry_unprocessed",
+        "raw_telemetry",
+        ["timestamp"],
+        unique=False,
+        postgresql_where=sa.text("processed = false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial index and restore the integer flag."""
+    if not _has_table("raw_telemetry"):
+        return
+
+    op.drop_index("ix_raw_telemetry_unprocessed", table_name="raw_telemetry")
+    op.alter_column(
+        "raw_telemetry",
+        "processed",
+        type_=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using="processed::integer",
+    )
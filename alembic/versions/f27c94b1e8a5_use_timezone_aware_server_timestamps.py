@@ -0,0 +1,64 @@
+"""Use timezone-aware, server-generated timestamps.
+
+Revision ID: f27c94b1e8a5
+Revises: e6b83f5a0d17
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f27c94b1e8a5"
+down_revision: Union[str, None] = "e6b83f5a0d17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = {
+    "sensor_readings": ("timestamp",),
+    "raw_telemetry": ("timestamp",),
+    "processed_readings": ("timestamp",),
+    "rolling_averages": ("timestamp", "created_at", "updated_at"),
+    "polling_configs": ("created_at", "updated_at"),
+}
+
+
+def _has_table(name: str) -> bool:
+    """Return True if the table exists (some tables are created by init_db)."""
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Convert naive UTC timestamps to timestamptz defaulting to now()."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if not _has_table(table):
+            continue
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    """Restore naive UTC timestamps without server defaults."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if not _has_table(table):
+            continue
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
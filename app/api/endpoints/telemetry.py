@@ -25,7 +25,7 @@ from app.schemas.telemetry import (
     PollingJobConfig,
 )
 from app.services.iot_service import IoTService
-from app.services.kafka_service import KafkaService
+from app.services.kafka_service import kafka_service
 
 router = APIRouter()
 
@@ -159,18 +159,12 @@ async def ingest_reading(
     Data persistence is handled by the background worker.
     """
     try:
-        # Create Kafka service
-        kafka_service = KafkaService()
-        
-        # Produce message to Kafka
+        # Produce message to Kafka via the shared producer
         success = await kafka_service.produce_message(
             topic="iot_stream_v1",
             key=reading_data.device_id,
             value=reading_data.model_dump()
         )
-        
-        # Close producer connection (in a real app, use a dependency/singleton)
-        await kafka_service.close()
 
         if not success:
              raise HTTPException(status_code=500, detail="Failed to publish event to Kafka")
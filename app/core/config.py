@@ -68,6 +68,31 @@ class Settings(BaseSettings):
         env="SQLALCHEMY_DATABASE_URI",
         description="SQLAlchemy database URI (deprecated, use DATABASE_URL)"
     )
+    DB_POOL_CLASS: str = Field(
+        default="queue",
+        env="DB_POOL_CLASS",
+        description="Connection pool class (queue or null)"
+    )
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        env="DB_POOL_SIZE",
+        description="Number of persistent connections kept in the pool"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=5,
+        env="DB_MAX_OVERFLOW",
+        description="Connections allowed above DB_POOL_SIZE under burst load"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=60,
+        env="DB_POOL_RECYCLE",
+        description="Seconds after which pooled connections are recycled"
+    )
+    TIMESCALEDB_ENABLED: bool = Field(
+        default=False,
+        env="TIMESCALEDB_ENABLED",
+        description="Convert time-series tables to TimescaleDB hypertables"
+    )
 
     # Redis settings
     REDIS_HOST: str = Field(
@@ -117,6 +142,21 @@ class Settings(BaseSettings):
         env="KAFKA_AUTO_OFFSET_RESET",
         description="Kafka auto offset reset policy"
     )
+    KAFKA_COMPRESSION_TYPE: str = Field(
+        default="lz4",
+        env="KAFKA_COMPRESSION_TYPE",
+        description="Producer compression codec (gzip, snappy, lz4, zstd)"
+    )
+    KAFKA_LINGER_MS: int = Field(
+        default=10,
+        env="KAFKA_LINGER_MS",
+        description="Time the producer waits to fill a batch, in milliseconds"
+    )
+    KAFKA_MAX_BATCH_SIZE: int = Field(
+        default=262144,
+        env="KAFKA_MAX_BATCH_SIZE",
+        description="Maximum producer batch size in bytes"
+    )
 
     # Security settings
     API_KEY: str = Field(
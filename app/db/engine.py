@@ -1,16 +1,53 @@
 """Database engine configuration."""
 
+from typing import Any, Dict
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+
+def _pool_options() -> Dict[str, Any]:
+    """
+    Build connection pool keyword arguments from settings.
+
+    Returns:
+        Keyword arguments for create_engine
+
+    Raises:
+        ValueError: If DB_POOL_CLASS is not "queue" or "null"
+    """
+    pool_class = settings.DB_POOL_CLASS.lower()
+    if pool_class == "null":
+        return {"poolclass": NullPool}
+    if pool_class != "queue":
+        raise ValueError(
+            f"Unsupported DB_POOL_CLASS {settings.DB_POOL_CLASS!r}; "
+            "expected 'queue' or 'null'"
+        )
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": 30,
+    }
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson."""
+    return orjson.dumps(value).decode()
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,
-    poolclass=NullPool,
+    pool_pre_ping=False,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_pool_options(),
 )
 
 # Create session factory
@@ -2,26 +2,11 @@
 
 from typing import Generator
 
+from sqlalchemy.orm import Session
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from app.db.engine import SessionLocal, engine
 
-from app.core.config import settings
-
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,
-    poolclass=NullPool,
-)
-
-# Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
+__all__ = ["SessionLocal", "engine", "get_db"]
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -0,0 +1,46 @@
+"""TimescaleDB hypertable setup."""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+# raw_telemetry is left as a plain table: processed_readings references its id,
+# and a hypertable's unique constraints must include the time column.
+HYPERTABLES = (
+    "sensor_readings",
+    "processed_readings",
+    "rolling_averages",
+    "market_data",
+)
+
+
+def create_hypertables(conn: Connection) -> None:
+    """
+    Partition existing time-series tables into daily chunks on timestamp.
+
+    Tables that are missing or already hypertables are skipped, so this is
+    safe to call from both migrations and init_db. The primary key becomes
+    (id, timestamp); the ORM models still map id alone as the identity,
+    which stays unique because it comes from the table's sequence or uuid4.
+
+    Args:
+        conn: Connection inside the caller's transaction
+    """
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+    existing = set(
+        conn.execute(
+            text("SELECT hypertable_name FROM timescaledb_information.hypertables")
+        ).scalars()
+    )
+    inspector = inspect(conn)
+    for table in HYPERTABLES:
+        if table in existing or not inspector.has_table(table):
+            continue
+        # Hypertable primary keys must include the partitioning column
+        conn.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey"))
+        conn.execute(text(f'ALTER TABLE {table} ADD PRIMARY KEY (id, "timestamp")'))
+        conn.execute(
+            text(
+                f"SELECT create_hypertable('{table}', 'timestamp', "
+                "chunk_time_interval => INTERVAL '1 day', migrate_data => true)"
+            )
+        )
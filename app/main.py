@@ -30,6 +30,7 @@ from app.core.logging import setup_logging
 from app.core.rate_limit import init_rate_limiter, rate_limit_middleware
 from app.db.session import get_db
 from app.services.iot_service import IoTService
+from app.services.kafka_service import kafka_service
 
 # Configure logging
 setup_logging()
@@ -75,6 +76,7 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error during application startup: {e}")
         raise
     finally:
+        await kafka_service.close()
         logger.info("Application shutdown complete")
 
 
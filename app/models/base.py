@@ -1,8 +1,6 @@
 """Base model for SQLAlchemy ORM models."""
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, func
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -12,7 +10,12 @@ Base = declarative_base()
 class TimestampMixin:
     """Mixin class that adds timestamp columns to models."""
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
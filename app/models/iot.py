@@ -1,55 +1,44 @@
 """IoT data models for the IoT Stream Engine."""
 
 import uuid
-from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Uuid,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.types import CHAR, TypeDecorator
 
 from app.db.base import Base
 
-
-# Cross-database UUID type
-class GUID(TypeDecorator):
-    """Platform-independent GUID type.
-
-    Uses PostgreSQL's UUID type, otherwise stores as CHAR(36).
-    """
-
-    impl = CHAR
-
-    def load_dialect_impl(self, dialect):
-        """Return the appropriate type descriptor for the dialect."""
-        if dialect.name == "postgresql":
-            return dialect.type_descriptor(PG_UUID(as_uuid=True))
-        else:
-            return dialect.type_descriptor(CHAR(36))
-
-    def process_bind_param(self, value, dialect):
-        """Convert Python value to a value suitable for the database."""
-        if value is None:
-            return value
-        if dialect.name == "postgresql":
-            return value
-        if not isinstance(value, uuid.UUID):
-            return str(uuid.UUID(value))
-        return str(value)
-
-    def process_result_value(self, value, dialect):
-        """Convert database value to a Python UUID object."""
-        if value is None:
-            return value
-        return uuid.UUID(value)
+# JSONB on PostgreSQL (binary, indexable), generic JSON elsewhere (e.g. SQLite).
+# none_as_null stores Python None as SQL NULL rather than the JSON value null.
+JSONType = JSON(none_as_null=True).with_variant(
+    JSONB(none_as_null=True), "postgresql"
+)
 
 
 class TimestampMixin:
     """Timestamp mixin for models."""
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
 
@@ -59,13 +48,26 @@ class SensorReading(Base):
     __tablename__ = "sensor_readings"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    device_id = Column(String, index=True, nullable=False)
+    device_id = Column(String, nullable=False)
     reading_value = Column(Float, nullable=False)
     reading_type = Column(String, nullable=False, index=True)
     unit = Column(String, nullable=False)
     battery_level = Column(Float, nullable=True)
-    raw_data = Column(String, nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    raw_data = Column(JSONType, nullable=True)
+    timestamp = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # Latest-N-per-device reads become a bounded range scan; on PostgreSQL the
+    # included reading_value lets rolling averages run index-only.
+    __table_args__ = (
+        Index(
+            "ix_sensor_readings_device_ts",
+            device_id,
+            timestamp.desc(),
+            postgresql_include=["reading_value"],
+        ),
+    )
 
     def __repr__(self) -> str:
         """
@@ -88,10 +90,21 @@ class RawTelemetry(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     device_id = Column(String, index=True, nullable=False)
-    raw_data = Column(String, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    raw_data = Column(JSONType, nullable=False)
+    timestamp = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     source = Column(String, nullable=False)  # Gateway or protocol source
-    processed = Column(Integer, default=0, nullable=False)
+    processed = Column(Boolean, default=False, nullable=False)
+
+    # Only the unprocessed backlog is indexed, oldest first
+    __table_args__ = (
+        Index(
+            "ix_raw_telemetry_unprocessed",
+            timestamp,
+            postgresql_where=text("processed = false"),
+        ),
+    )
 
     def __repr__(self) -> str:
         """
@@ -114,7 +127,9 @@ class ProcessedReading(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     device_id = Column(String, index=True, nullable=False)
     reading_value = Column(Float, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     raw_telemetry_id = Column(Integer, ForeignKey("raw_telemetry.id"))
     raw_telemetry = relationship("RawTelemetry")
 
@@ -136,21 +151,32 @@ class RollingAverage(Base, TimestampMixin):
 
     __tablename__ = "rolling_averages"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    device_id = Column(String, nullable=False, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    device_id = Column(String, nullable=False)
     average_value = Column(Float, nullable=False)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
     window_size = Column(Integer, nullable=False)
     reading_type = Column(String, nullable=False, default="default")
 
+    __table_args__ = (
+        Index(
+            "ix_rolling_averages_device_type_ts",
+            device_id,
+            reading_type,
+            timestamp.desc(),
+        ),
+    )
+
 
 class PollingConfig(Base, TimestampMixin):
     """Polling config model."""
 
     __tablename__ = "polling_configs"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     job_id = Column(String, nullable=False, unique=True, index=True)
-    device_ids = Column(JSON, nullable=False)  # Array of device IDs
+    device_ids = Column(JSONType, nullable=False)  # Array of device IDs
     interval = Column(Integer, nullable=False)  # Interval in seconds
     status = Column(String, nullable=False)  # active, paused, completed
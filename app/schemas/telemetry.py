@@ -1,7 +1,8 @@
 """Telemetry schemas for the IoT Stream Engine."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -83,13 +84,37 @@ class SensorReadingBase(BaseModel):
     reading_type: str = Field(..., description="Type of reading (e.g. temperature, humidity)")
     unit: str = Field(..., description="Unit of measurement (e.g. Celsius, Volts)")
     battery_level: Optional[float] = Field(None, ge=0, le=100, description="Device battery level percentage")
-    raw_data: Optional[str] = Field(None, description="Raw sensor payload")
+    raw_data: Optional[Dict[str, Any]] = Field(None, description="Raw sensor payload")
 
 
 class SensorReadingCreate(SensorReadingBase):
     """Schema for creating a new sensor reading."""
 
 
+@dataclass(slots=True, frozen=True)
+class ReadingRow:
+    """Compact, already-validated sensor reading row for bulk ingest batches."""
+
+    device_id: str
+    reading_value: float
+    reading_type: str
+    unit: str
+    battery_level: Optional[float] = None
+    raw_data: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_schema(cls, reading: SensorReadingCreate) -> "ReadingRow":
+        """Build a row from a validated creation schema."""
+        return cls(
+            reading.device_id,
+            reading.reading_value,
+            reading.reading_type,
+            reading.unit,
+            reading.battery_level,
+            reading.raw_data,
+        )
+
+
 class SensorReadingUpdate(BaseModel):
     """Schema for updating a sensor reading."""
 
@@ -98,7 +123,7 @@ class SensorReadingUpdate(BaseModel):
     reading_type: Optional[str] = Field(None, description="Type of reading")
     unit: Optional[str] = Field(None, description="Unit of measurement")
     battery_level: Optional[float] = Field(None, ge=0, le=100, description="Device battery level")
-    raw_data: Optional[str] = Field(None, description="Raw sensor payload")
+    raw_data: Optional[Dict[str, Any]] = Field(None, description="Raw sensor payload")
 
 
 class SensorReadingInDB(SensorReadingBase):
@@ -106,6 +131,10 @@ class SensorReadingInDB(SensorReadingBase):
 
     id: int = Field(..., description="Reading ID")
     timestamp: datetime = Field(..., description="Timestamp of the reading")
+    # Rows migrated from the old text column may hold a plain string payload
+    raw_data: Optional[Union[Dict[str, Any], str]] = Field(
+        None, description="Raw sensor payload"
+    )
 
     class Config:
         """Pydantic model configuration."""
@@ -116,7 +145,7 @@ class RawTelemetryBase(BaseModel):
     """Base schema for raw telemetry."""
 
     device_id: str = Field(..., description="IoT Device ID")
-    raw_data: str = Field(..., description="Raw telemetry payload")
+    raw_data: Dict[str, Any] = Field(..., description="Raw telemetry payload")
     source: str = Field(..., description="Source system or gateway")
 
 
@@ -129,7 +158,11 @@ class RawTelemetryInDB(RawTelemetryBase):
 
     id: int = Field(..., description="Raw telemetry ID")
     timestamp: datetime = Field(..., description="Timestamp of the data")
-    processed: int = Field(..., description="Processing status (0=pending, 1=processed)")
+    # Rows migrated from the old text column may hold a plain string payload
+    raw_data: Union[Dict[str, Any], str] = Field(
+        ..., description="Raw telemetry payload"
+    )
+    processed: bool = Field(..., description="Whether the telemetry has been processed")
 
     class Config:
         """Pydantic model configuration."""
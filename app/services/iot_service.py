@@ -1,19 +1,37 @@
 """IoT service module for handling sensor data operations."""
 
 import asyncio
+import csv
+import io
 import logging
+from dataclasses import fields
 from datetime import UTC, datetime
 from functools import wraps
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
 
+import orjson
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from app.models.iot import SensorReading
-from app.schemas.telemetry import SensorReadingCreate, SensorReadingUpdate
+from app.schemas.telemetry import (
+    ReadingRow,
+    SensorReadingCreate,
+    SensorReadingUpdate,
+)
 from app.services.redis_service import RedisService
 
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 5000
+
+# Column order shared by the INSERT parameters and the COPY column list;
+# raw_data must stay last so the COPY writer can serialize it.
+READING_COLUMNS = tuple(field.name for field in fields(ReadingRow))
+_row_values = attrgetter(*READING_COLUMNS)
+
 
 def retry_on_failure(max_retries=3, delay=1):
     """
@@ -112,6 +130,65 @@ class IoTService:
         db.refresh(db_obj)
         return db_obj
 
+    @staticmethod
+    def bulk_insert_readings(conn: Connection, readings: Sequence[ReadingRow]) -> int:
+        """
+        Insert a batch of sensor readings with a Core INSERT.
+
+        Bypasses the ORM unit of work (no identity map, no refresh), so use it
+        for ingest paths that do not need the created objects back. Batches of
+        COPY_THRESHOLD rows or more are streamed with COPY on psycopg2. The
+        caller owns the transaction, e.g. ``with engine.begin() as conn``.
+
+        Args:
+            conn: Database connection
+            readings: Validated reading rows to create
+
+        Returns:
+            Number of readings inserted
+        """
+        if not readings:
+            return 0
+        if len(readings) >= COPY_THRESHOLD and conn.dialect.driver == "psycopg2":
+            IoTService._copy_readings(conn, readings)
+        else:
+            conn.execute(
+                SensorReading.__table__.insert(),
+                [dict(zip(READING_COLUMNS, _row_values(row))) for row in readings],
+            )
+        return len(readings)
+
+    @staticmethod
+    def _copy_readings(conn: Connection, readings: Sequence[ReadingRow]) -> None:
+        """
+        Stream readings into sensor_readings with COPY FROM STDIN.
+
+        Args:
+            conn: Database connection using the psycopg2 driver
+            readings: Validated reading rows to create
+        """
+        buf = io.StringIO()
+        # Strings are always quoted, so FORCE_NULL turns only the quoted
+        # empty values written for None into NULL.
+        writer = csv.writer(buf, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        for row in readings:
+            *values, raw_data = _row_values(row)
+            values.append(
+                orjson.dumps(raw_data).decode() if raw_data is not None else None
+            )
+            writer.writerow(values)
+        buf.seek(0)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY sensor_readings ({', '.join(READING_COLUMNS)}) FROM STDIN "
+                "WITH (FORMAT CSV, FORCE_NULL (battery_level, raw_data))",
+                buf,
+            )
+        finally:
+            cursor.close()
+
     @staticmethod
     def update_reading(
         db: Session, reading_id: int, reading: SensorReadingUpdate
@@ -1,12 +1,12 @@
 """Kafka service module for handling Kafka operations."""
 
 import asyncio
-import json
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import orjson
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
-from aiokafka.errors import KafkaError
 
 from app.core.config import settings
 from app.services.iot_service import IoTService
@@ -14,91 +14,185 @@ from app.services.iot_service import IoTService
 logger = logging.getLogger(__name__)
 
 
+def _deserialize_value(raw: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """Decode a message value, returning None for empty or malformed payloads."""
+    if raw is None:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        logger.error(f"Failed to decode message: {raw!r}")
+        return None
+
+
+def _deserialize_key(raw: Optional[bytes]) -> Optional[str]:
+    """Decode a message key, which may be absent."""
+    return raw.decode("utf-8") if raw is not None else None
+
+
 class KafkaService:
     """Service class for handling Kafka operations."""
 
-    def __init__(self) -> None:
-        """Initialize Kafka service without immediate connection."""
+    def __init__(self, auto_commit: bool = True) -> None:
+        """
+        Initialize Kafka service without immediate connection.
+
+        Args:
+            auto_commit: Let the consumer commit offsets in the background;
+                pass False to commit explicitly with commit()
+        """
+        self.auto_commit = auto_commit
         self.producer: Optional[AIOKafkaProducer] = None
         self.consumer: Optional[AIOKafkaConsumer] = None
-        self._lock = asyncio.Lock()
+        self._producer_lock = asyncio.Lock()
+        self._consumer_lock = asyncio.Lock()
+        # Device ids repeat constantly, so keep their encoded keys around
+        self._key_cache = functools.lru_cache(maxsize=4096)(str.encode)
 
     async def _get_producer(self) -> Optional[AIOKafkaProducer]:
         """Get the Kafka producer, creating it if it doesn't exist."""
-        async with self._lock:
+        # Fast path: self.producer is only set after start() succeeds
+        if self.producer is not None:
+            return self.producer
+        async with self._producer_lock:
             if self.producer is None:
                 try:
-                    self.producer = AIOKafkaProducer(
-                        bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS
+                    producer = AIOKafkaProducer(
+                        bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
+                        compression_type=settings.KAFKA_COMPRESSION_TYPE,
+                        linger_ms=settings.KAFKA_LINGER_MS,
+                        max_batch_size=settings.KAFKA_MAX_BATCH_SIZE,
+                        acks=1,
+                        enable_idempotence=False,
                     )
-                    await self.producer.start()
+                    await producer.start()
                 except Exception as e:
                     logger.error(f"Error connecting to Kafka producer: {e}")
-                    self.producer = None
                     return None
+                self.producer = producer
         return self.producer
 
     async def _get_consumer(self, topic: str) -> Optional[AIOKafkaConsumer]:
         """Get the Kafka consumer, creating it if it doesn't exist."""
-        async with self._lock:
+        # Fast path: self.consumer is only set after start() succeeds
+        if self.consumer is not None:
+            return self.consumer
+        async with self._consumer_lock:
             if self.consumer is None:
                 try:
-                    self.consumer = AIOKafkaConsumer(
+                    consumer = AIOKafkaConsumer(
                         topic,
                         bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
                         group_id=settings.KAFKA_CONSUMER_GROUP,
+                        value_deserializer=_deserialize_value,
+                        key_deserializer=_deserialize_key,
+                        max_partition_fetch_bytes=2 * 1024 * 1024,
+                        enable_auto_commit=self.auto_commit,
                     )
-                    await self.consumer.start()
+                    await consumer.start()
                 except Exception as e:
                     logger.error(f"Error connecting to Kafka consumer: {e}")
-                    self.consumer = None
                     return None
+                self.consumer = consumer
         return self.consumer
 
     async def produce_message(
         self, topic: str, key: str, value: Dict[str, Any]
     ) -> bool:
-        """Produce a message to Kafka."""
+        """
+        Queue a message for delivery to Kafka.
+
+        The producer batches queued messages and sends them after linger_ms,
+        so True means the message was accepted, not yet acknowledged.
+        """
         producer = await self._get_producer()
         if not producer:
             return False
 
         try:
-            await producer.send_and_wait(
-                topic, json.dumps(value).encode(), key=key.encode()
+            fut = await producer.send(
+                topic, orjson.dumps(value), key=self._key_cache(key)
             )
+            fut.add_done_callback(self._log_delivery_failure)
             return True
         except Exception as e:
             self._log_error("Kafka msg err", e)
             return False
 
     async def consume_messages(
-        self, topic: str, timeout: int = 1000
+        self, topic: str, timeout: int = 1000, max_records: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Consume messages from Kafka."""
+        """Consume up to max_records messages from Kafka in one fetch."""
         consumer = await self._get_consumer(topic)
         if not consumer:
             return []
 
         try:
-            messages = []
-            result = await consumer.getmany(timeout_ms=timeout)
-            for tp, msgs in result.items():
-                for msg in msgs:
-                    try:
-                        value = json.loads(msg.value.decode("utf-8"))
-                        messages.append(value)
-                    except json.JSONDecodeError:
-                        logger.error(f"Failed to decode message: {msg.value}")
-            return messages
+            result = await consumer.getmany(
+                timeout_ms=timeout, max_records=max_records
+            )
+            # Values are already decoded by the consumer's value_deserializer
+            return [
+                msg.value
+                for msgs in result.values()
+                for msg in msgs
+                if msg.value is not None
+            ]
         except Exception as e:
             self._log_error("Kafka msg err", e)
             return []
 
+    async def stream(
+        self, topic: str, timeout: int = 200, max_records: int = 10000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Continuously consume decoded messages from Kafka, one fetch at a time.
+
+        Each yielded list holds the messages from a single getmany call. The
+        same list object is reused between iterations, so callers must finish
+        with (or copy) a batch before requesting the next one.
+
+        Args:
+            topic: Topic to consume
+            timeout: Maximum time to wait for records per fetch, in milliseconds
+            max_records: Maximum number of records per fetch
+
+        Yields:
+            Batch of decoded message values
+        """
+        consumer = await self._get_consumer(topic)
+        if not consumer:
+            return
+
+        batch: List[Dict[str, Any]] = []
+        while True:
+            result = await consumer.getmany(
+                timeout_ms=timeout, max_records=max_records
+            )
+            batch.clear()
+            batch.extend(
+                msg.value
+                for msgs in result.values()
+                for msg in msgs
+                if msg.value is not None
+            )
+            if batch:
+                yield batch
+
+    async def commit(self) -> None:
+        """Commit the consumer's offsets for every message fetched so far."""
+        if self.consumer is not None:
+            await self.consumer.commit()
+
     def _log_error(self, msg: str, exc: Exception) -> None:
         """Log error with proper formatting."""
         logger.error(f"{msg}: {exc}")
 
+    def _log_delivery_failure(self, fut: asyncio.Future) -> None:
+        """Log a queued message that the broker failed to acknowledge."""
+        if not fut.cancelled() and fut.exception() is not None:
+            self._log_error("Kafka delivery err", fut.exception())
+
     async def close(self) -> None:
         """Close the Kafka producer and consumer."""
         try:
@@ -125,73 +219,65 @@ class KafkaService:
 
     async def produce_reading_event(
         self, device_id: str, reading_value: float, topic: str = "telemetry-events"
-    ) -> bool:
-        """Produce a telemetry reading event to Kafka."""
+    ) -> Optional[asyncio.Future]:
+        """
+        Queue a telemetry reading event for delivery to Kafka.
+
+        Returns:
+            Future resolving to the record metadata once the broker acknowledges
+            the batch (await it for durability), or None if queueing failed
+        """
         producer = await self._get_producer()
         if not producer:
-            return False
+            return None
 
         message = {"device_id": device_id, "reading_value": reading_value}
         try:
-            await producer.send_and_wait(
-                topic, key=device_id.encode(), value=json.dumps(message).encode()
+            fut = await producer.send(
+                topic, key=self._key_cache(device_id), value=orjson.dumps(message)
             )
-            return True
+            fut.add_done_callback(self._log_delivery_failure)
+            return fut
         except Exception as e:
             self._log_error("Kafka msg err", e)
-            return False
+            return None
 
-    def consume_reading_events(self, iot_service: IoTService) -> None:
+    async def consume_reading_events(
+        self, iot_service: IoTService, topic: str = "telemetry-events"
+    ) -> None:
         """
-        Consume telemetry events and perform actions.
+        Consume telemetry events and update rolling averages.
+
+        Events are handled one fetch at a time, and the rolling average is
+        computed once per device in each fetch rather than once per event.
 
         Args:
             iot_service: IoT service instance
+            topic: Topic carrying telemetry reading events
         """
-        if not self.consumer:
-            # Initialize consumer if not already done
-            asyncio.create_task(self._get_consumer("telemetry-events"))
-            return
-
-        try:
-            while True:
-                msg = self.consumer.poll(1.0)
-
-                if msg is None:
-                    continue
-
-                if msg.error():
-                    if msg.error().code() == KafkaError._PARTITION_EOF:
-                        continue
-                    else:
-                        logger.error(f"Consumer error: {msg.error()}")
-                        continue
-
+        async for events in self.stream(topic):
+            # Payloads can be any JSON value, so skip events that aren't
+            # objects or lack a string device_id instead of failing the loop
+            device_ids = {
+                event["device_id"]
+                for event in events
+                if isinstance(event, dict)
+                and isinstance(event.get("device_id"), str)
+            }
+            for device_id in device_ids:
                 try:
-                    data = json.loads(msg.value().decode("utf-8"))
-                    device_id = data.get("device_id")
-
-                    # Calculate rolling average using IoTService logic
-                    # Using db from service instance or creation a new session strategy
-                    # Here assuming service has db session attached as per legacy code structure
-                    
-                    if device_id:
-                        ma = iot_service.calculate_rolling_average(
-                            iot_service.db, device_id
-                        )
-                        if ma is not None:
-                            logger.info(f"Calculated rolling average for {device_id}: {ma}")
-
+                    ma = iot_service.calculate_rolling_average(
+                        iot_service.db, device_id
+                    )
+                    if ma is not None:
+                        logger.info(f"Calculated rolling average for {device_id}: {ma}")
                 except Exception as e:
                     self._log_error("Kafka msg err", e)
-                    continue
-
-        except KeyboardInterrupt:
-            pass
-        finally:
-            if self.consumer:
-                pass # .close() is async, avoided here to keep consistent with legacy sync method structure
 
     def some_method(self):
         """Describe what this method does."""
         # ... existing code ...
+
+
+# Shared instance so API requests reuse one producer connection
+kafka_service = KafkaService()
@@ -5,8 +5,10 @@ import os
 # Add current directory to python path to find 'app'
 sys.path.append(os.getcwd())
 
+from app.core.config import settings
 from app.db.base import Base
 from app.db.session import engine
+from app.db.timescale import create_hypertables
 # Import models to ensure they are registered
 from app.models import iot
 
@@ -15,6 +17,10 @@ def init_db():
     try:
         Base.metadata.create_all(bind=engine)
         print("Tables created successfully.")
+        if settings.TIMESCALEDB_ENABLED:
+            with engine.begin() as conn:
+                create_hypertables(conn)
+            print("Hypertables created successfully.")
     except Exception as e:
         print(f"Error creating tables: {e}")
 
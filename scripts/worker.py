@@ -1,6 +1,5 @@
 
 import asyncio
-import json
 import logging
 import os
 import sys
@@ -8,11 +7,11 @@ import sys
 # Add current directory to python path to find 'app'
 sys.path.append(os.getcwd())
 
-from app.db.session import SessionLocal
+from app.db.session import engine
 from app.api.endpoints.telemetry import telemetry_points_total
 from app.services.kafka_service import KafkaService
 from app.services.iot_service import IoTService
-from app.schemas.telemetry import SensorReadingCreate
+from app.schemas.telemetry import ReadingRow, SensorReadingCreate
 
 # Configure logging
 logging.basicConfig(
@@ -21,47 +20,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger("iot-worker")
 
-async def process_message(db, message: dict):
-    """Process a single message and save to DB."""
+# Each fetch returns up to BATCH_SIZE messages, waiting at most
+# FLUSH_INTERVAL_MS when the topic is idle; every fetch is flushed as one batch.
+TOPIC = "iot_stream_v1"
+BATCH_SIZE = 5000
+FLUSH_INTERVAL_MS = 200
+MAX_FLUSH_ATTEMPTS = 3
+FLUSH_RETRY_DELAY = 1  # seconds, multiplied by the attempt number
+
+
+def parse_message(message: dict):
+    """Validate a decoded message into an insert row, or None if it is invalid."""
     try:
-        # Validate and convert to schema
-        reading_data = SensorReadingCreate(**message)
-        
-        # synchronous db write
-        IoTService.create_reading(db, reading_data)
-        
-        logger.info(f"Ingested reading for device {reading_data.device_id}")
+        return ReadingRow.from_schema(SensorReadingCreate.model_validate(message))
     except Exception as e:
         logger.error(f"Error processing message: {e}")
+        return None
+
+
+def flush_batch(batch: list) -> None:
+    """Write a batch of readings to the DB in a single short transaction."""
+    if not batch:
+        return
+    with engine.begin() as conn:
+        count = IoTService.bulk_insert_readings(conn, batch)
+    logger.info(f"Ingested batch of {count} readings")
+
+
+async def write_batch(batch: list) -> None:
+    """Flush a batch, retrying transient DB errors before giving up."""
+    for attempt in range(1, MAX_FLUSH_ATTEMPTS + 1):
+        try:
+            # Run the blocking DB write off the event loop so aiokafka's
+            # heartbeats keep flowing while a large batch is written.
+            await asyncio.to_thread(flush_batch, batch)
+            return
+        except Exception as e:
+            if attempt == MAX_FLUSH_ATTEMPTS:
+                logger.error(
+                    f"Error writing batch of {len(batch)} readings "
+                    f"after {MAX_FLUSH_ATTEMPTS} attempts: {e}"
+                )
+                raise
+            logger.warning(f"Batch write attempt {attempt} failed: {e}")
+            await asyncio.sleep(FLUSH_RETRY_DELAY * attempt)
+
 
 async def main():
     logger.info("Starting IoT Worker...")
     
-    kafka_service = KafkaService()
-    db = SessionLocal()
+    # Offsets are committed only once a batch is in the DB, so a failed
+    # write is re-delivered after the worker restarts instead of being lost.
+    kafka_service = KafkaService(auto_commit=False)
     
     try:
         # Get consumer for "iot_stream_v1"
-        consumer = await kafka_service._get_consumer("iot_stream_v1")
+        consumer = await kafka_service._get_consumer(TOPIC)
         if not consumer:
             logger.error("Failed to connect to Kafka. Exiting.")
-            return
+            sys.exit(1)
 
         logger.info("Connected to Kafka. Listening for messages...")
         
-        async for msg in consumer:
-            try:
-                value = json.loads(msg.value.decode("utf-8"))
-                await process_message(db, value)
-            except json.JSONDecodeError:
-                logger.error(f"Failed to decode message: {msg.value}")
-            except Exception as e:
-                logger.error(f"Error in consumer loop: {e}")
+        async for messages in kafka_service.stream(
+            TOPIC, timeout=FLUSH_INTERVAL_MS, max_records=BATCH_SIZE
+        ):
+            batch = [row for row in map(parse_message, messages) if row is not None]
+            await write_batch(batch)
+            await kafka_service.commit()
                 
     except Exception as e:
         logger.error(f"Worker crashed: {e}")
+        # Exit non-zero so the container restart policy brings the worker
+        # back and the uncommitted batch is consumed again.
+        raise
     finally:
-        db.close()
         await kafka_service.close()
         logger.info("Worker stopped.")
 
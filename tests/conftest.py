@@ -1,6 +1,7 @@
 """Test configuration and fixtures."""
 
 import asyncio
+import os
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
@@ -10,14 +11,16 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.core.rate_limit import init_rate_limiter
-from app.db.base import Base
-from app.db.session import get_db
-from app.main import app
-from app.models.iot import SensorReading
-from app.schemas.telemetry import SensorReadingCreate
+# Don't keep application DB connections pooled between tests. This must be
+# set before the app (and its engine) is imported, and overrides the shell.
+os.environ["DB_POOL_CLASS"] = "null"
 
-pytest_plugins = ("pytest_asyncio",)
+from app.core.rate_limit import init_rate_limiter  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.iot import SensorReading  # noqa: E402
+from app.schemas.telemetry import SensorReadingCreate  # noqa: E402
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -90,7 +93,7 @@ class DummyIoTService:
             reading_type=str(reading.reading_type),
             unit=str(reading.unit),
             battery_level=reading.battery_level,
-            raw_data=str(reading.raw_data) if reading.raw_data else None,
+            raw_data=reading.raw_data,
             timestamp=datetime.now(timezone.utc),
         )
 
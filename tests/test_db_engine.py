@@ -0,0 +1,35 @@
+"""Tests for the database engine configuration."""
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.engine import _pool_options
+
+
+class TestPoolOptions:
+    """Test cases for connection pool settings."""
+
+    def test_null_pool(self, monkeypatch):
+        """Test DB_POOL_CLASS=null disables pooling."""
+        monkeypatch.setattr(settings, "DB_POOL_CLASS", "null")
+
+        assert _pool_options() == {"poolclass": NullPool}
+
+    def test_queue_pool_keeps_zero_overflow(self, monkeypatch):
+        """Test an explicit zero is passed through rather than replaced."""
+        monkeypatch.setattr(settings, "DB_POOL_CLASS", "queue")
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+        monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+
+        options = _pool_options()
+
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 0
+
+    def test_unknown_pool_class(self, monkeypatch):
+        """Test an unsupported DB_POOL_CLASS is rejected."""
+        monkeypatch.setattr(settings, "DB_POOL_CLASS", "static")
+
+        with pytest.raises(ValueError, match="DB_POOL_CLASS"):
+            _pool_options()
@@ -0,0 +1,123 @@
+"""Tests for the IoT service bulk ingest path."""
+
+from unittest.mock import Mock
+
+from app.models.iot import SensorReading
+from app.schemas.telemetry import ReadingRow, SensorReadingCreate
+from app.services import iot_service
+from app.services.iot_service import READING_COLUMNS, IoTService
+
+ROWS = [
+    ReadingRow("dev-1", 21.5, "temperature", "C", None, {"a": 1}),
+    ReadingRow("dev-2", 3.0, "voltage", "V", 87.0, None),
+]
+
+
+class TestReadingRow:
+    """Test cases for the bulk ingest row type."""
+
+    def test_from_schema(self):
+        """Test building a row from a validated creation schema."""
+        reading = SensorReadingCreate(
+            device_id="dev-1",
+            reading_value=21.5,
+            reading_type="temperature",
+            unit="C",
+            raw_data={"a": 1},
+        )
+
+        assert ReadingRow.from_schema(reading) == ROWS[0]
+
+    def test_raw_data_is_last_column(self):
+        """Test the COPY writer's assumption that raw_data is the last column."""
+        assert READING_COLUMNS[-1] == "raw_data"
+
+
+class TestBulkInsertReadings:
+    """Test cases for IoTService.bulk_insert_readings."""
+
+    def test_inserts_rows(self, db_session):
+        """Test rows written with a Core INSERT can be read back."""
+        count = IoTService.bulk_insert_readings(db_session.connection(), ROWS)
+        db_session.commit()
+
+        readings = db_session.query(SensorReading).order_by(SensorReading.id).all()
+        assert count == 2
+        assert [
+            (r.device_id, r.reading_value, r.reading_type, r.unit, r.battery_level)
+            for r in readings
+        ] == [
+            ("dev-1", 21.5, "temperature", "C", None),
+            ("dev-2", 3.0, "voltage", "V", 87.0),
+        ]
+        assert readings[0].raw_data == {"a": 1}
+
+    def test_missing_raw_data_is_sql_null(self, db_session):
+        """Test a missing payload is stored as SQL NULL, not JSON null."""
+        IoTService.bulk_insert_readings(db_session.connection(), ROWS)
+        db_session.commit()
+
+        missing = db_session.query(SensorReading).filter(
+            SensorReading.raw_data.is_(None)
+        )
+        assert [r.device_id for r in missing] == ["dev-2"]
+
+    def test_empty_batch(self):
+        """Test an empty batch does not touch the connection."""
+        conn = Mock()
+
+        assert IoTService.bulk_insert_readings(conn, []) == 0
+        conn.execute.assert_not_called()
+
+    def test_large_batch_uses_copy_on_psycopg2(self, monkeypatch):
+        """Test batches at the COPY threshold are loaded with COPY."""
+        monkeypatch.setattr(iot_service, "COPY_THRESHOLD", 2)
+        copy_readings = Mock()
+        monkeypatch.setattr(IoTService, "_copy_readings", copy_readings)
+        conn = Mock()
+        conn.dialect.driver = "psycopg2"
+
+        assert IoTService.bulk_insert_readings(conn, ROWS) == 2
+        copy_readings.assert_called_once_with(conn, ROWS)
+        conn.execute.assert_not_called()
+
+    def test_large_batch_uses_insert_on_other_drivers(
+        self, db_session, monkeypatch
+    ):
+        """Test drivers without COPY support fall back to INSERT."""
+        monkeypatch.setattr(iot_service, "COPY_THRESHOLD", 2)
+        copy_readings = Mock()
+        monkeypatch.setattr(IoTService, "_copy_readings", copy_readings)
+
+        IoTService.bulk_insert_readings(db_session.connection(), ROWS)
+        db_session.commit()
+
+        copy_readings.assert_not_called()
+        assert db_session.query(SensorReading).count() == 2
+
+
+class TestCopyReadings:
+    """Test cases for the COPY FROM STDIN writer."""
+
+    def test_copy_payload(self):
+        """Test the exact CSV and statement sent to copy_expert."""
+        sent = {}
+        conn = Mock()
+        cursor = conn.connection.cursor.return_value
+        cursor.copy_expert.side_effect = lambda sql, buf: sent.update(
+            sql=sql, data=buf.read()
+        )
+
+        IoTService._copy_readings(conn, ROWS)
+
+        assert sent["sql"] == (
+            "COPY sensor_readings (device_id, reading_value, reading_type, unit, "
+            "battery_level, raw_data) FROM STDIN "
+            "WITH (FORMAT CSV, FORCE_NULL (battery_level, raw_data))"
+        )
+        # None is written as a quoted empty value, which FORCE_NULL maps to NULL
+        assert sent["data"] == (
+            '"dev-1",21.5,"temperature","C","","{""a"":1}"\n'
+            '"dev-2",3.0,"voltage","V",87.0,""\n'
+        )
+        cursor.close.assert_called_once()
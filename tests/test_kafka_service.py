@@ -0,0 +1,97 @@
+"""Tests for the Kafka service."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.kafka_service import (
+    KafkaService,
+    _deserialize_key,
+    _deserialize_value,
+)
+
+
+class StopConsuming(Exception):
+    """Raised by FakeConsumer once its scripted fetches run out."""
+
+
+class FakeConsumer:
+    """Consumer stub whose getmany returns scripted message values."""
+
+    def __init__(self, *fetches):
+        self.fetches = list(fetches)
+
+    async def getmany(self, timeout_ms=0, max_records=None):
+        if not self.fetches:
+            raise StopConsuming
+        values = self.fetches.pop(0)
+        return {"tp": [SimpleNamespace(value=value) for value in values]}
+
+
+def make_service(*fetches) -> KafkaService:
+    """Build a service whose consumer is already connected."""
+    service = KafkaService()
+    service.consumer = FakeConsumer(*fetches)
+    return service
+
+
+class TestDeserializers:
+    """Test cases for the consumer deserializers."""
+
+    def test_value(self):
+        """Test JSON payloads are decoded."""
+        assert _deserialize_value(b'{"device_id":"dev-1"}') == {"device_id": "dev-1"}
+
+    def test_value_malformed(self):
+        """Test malformed payloads decode to None."""
+        assert _deserialize_value(b"not json") is None
+        assert _deserialize_value(None) is None
+
+    def test_key(self):
+        """Test keys are decoded and may be absent."""
+        assert _deserialize_key(b"dev-1") == "dev-1"
+        assert _deserialize_key(None) is None
+
+
+class TestStream:
+    """Test cases for KafkaService.stream."""
+
+    @pytest.mark.asyncio_cooperative
+    async def test_yields_each_fetch(self):
+        """Test each non-empty fetch is yielded once, without None values."""
+        service = make_service([{"n": 1}, None], [], [{"n": 2}])
+        stream = service.stream("topic")
+
+        first = await stream.__anext__()
+        assert first == [{"n": 1}]
+        second = await stream.__anext__()
+        assert second == [{"n": 2}]
+        # The batch list is reused between fetches
+        assert second is first
+
+        with pytest.raises(StopConsuming):
+            await stream.__anext__()
+
+
+class TestConsumeReadingEvents:
+    """Test cases for KafkaService.consume_reading_events."""
+
+    @pytest.mark.asyncio_cooperative
+    async def test_skips_malformed_events(self):
+        """Test non-object events and bad device ids don't stop the loop."""
+        service = make_service(
+            [[1, 2], 5, {"device_id": ["dev-x"]}, {"device_id": "dev-1"}],
+            [{"device_id": "dev-1"}, {"device_id": "dev-1"}],
+        )
+        iot_service = Mock()
+        iot_service.calculate_rolling_average.return_value = 20.0
+
+        with pytest.raises(StopConsuming):
+            await service.consume_reading_events(iot_service)
+
+        # Once per device per fetch
+        assert iot_service.calculate_rolling_average.call_count == 2
+        iot_service.calculate_rolling_average.assert_called_with(
+            iot_service.db, "dev-1"
+        )
@@ -0,0 +1,52 @@
+"""Tests for the ingest worker script."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.schemas.telemetry import ReadingRow
+from scripts import worker
+
+MESSAGE = {
+    "device_id": "dev-1",
+    "reading_value": 21.5,
+    "reading_type": "temperature",
+    "unit": "C",
+}
+
+
+class TestParseMessage:
+    """Test cases for worker.parse_message."""
+
+    def test_valid_message(self):
+        """Test a valid message becomes an insert row."""
+        assert worker.parse_message(MESSAGE) == ReadingRow(
+            "dev-1", 21.5, "temperature", "C"
+        )
+
+    def test_invalid_message(self):
+        """Test an invalid message is dropped."""
+        assert worker.parse_message({"device_id": "dev-1"}) is None
+
+
+class TestWriteBatch:
+    """Test cases for worker.write_batch."""
+
+    @pytest.mark.asyncio_cooperative
+    async def test_retries_then_gives_up(self):
+        """Test transient failures are retried and persistent ones re-raised."""
+        batch = [worker.parse_message(MESSAGE)]
+        # Both scenarios share one test so their patches never overlap
+        # with another cooperative test touching the same globals.
+        with patch.object(worker, "FLUSH_RETRY_DELAY", 0):
+            flaky = Mock(side_effect=[RuntimeError("db down"), None])
+            with patch.object(worker, "flush_batch", flaky):
+                await worker.write_batch(batch)
+            assert flaky.call_count == 2
+            flaky.assert_called_with(batch)
+
+            broken = Mock(side_effect=RuntimeError("db down"))
+            with patch.object(worker, "flush_batch", broken):
+                with pytest.raises(RuntimeError):
+                    await worker.write_batch(batch)
+            assert broken.call_count == worker.MAX_FLUSH_ATTEMPTS